@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from api.models import EmailOTP
+
+
+class Command(BaseCommand):
+    help = "Delete email OTPs whose expiry has passed. Intended to run periodically (e.g. from cron)."
+
+    def handle(self, *args, **options):
+        deleted, _ = EmailOTP.objects.filter(expires_at__lt=timezone.now()).delete()
+        self.stdout.write(f"Deleted {deleted} expired OTP(s).")
@@ -0,0 +1,18 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("api", "0015_userprofile_nickname"),
+    ]
+
+    operations = [
+        # auth.User is not ours to add Meta.indexes to, so the case-insensitive
+        # email lookup index is created directly.
+        migrations.RunSQL(
+            sql='CREATE INDEX IF NOT EXISTS "api_user_email_lower_idx" ON "auth_user" (LOWER("email"));',
+            reverse_sql='DROP INDEX IF EXISTS "api_user_email_lower_idx";',
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8 on 2026-10-15 08:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0016_user_email_lower_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='emailotp',
+            index=models.Index(fields=['email', 'purpose', '-created_at'], name='api_emailot_email_638e33_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+from django.db import migrations
+from django.db.models.functions import Lower, Trim
+
+
+def lowercase_otp_emails(apps, schema_editor):
+    EmailOTP = apps.get_model("api", "EmailOTP")
+    EmailOTP.objects.update(email=Lower(Trim("email")))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0017_emailotp_lookup_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(lowercase_otp_emails, reverse_code=migrations.RunPython.noop),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.8 on 2026-10-15 08:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0018_lowercase_emailotp_email'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='emailotp',
+            name='api_emailot_email_ab57e8_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='emailotp',
+            name='api_emailot_token_79673b_idx',
+        ),
+        migrations.AddIndex(
+            model_name='emailotp',
+            index=models.Index(fields=['expires_at'], name='api_emailot_expires_037b79_idx'),
+        ),
+    ]
@@ -150,14 +150,22 @@ class EmailOTP(models.Model):
 
     class Meta:
         indexes = [
-            models.Index(fields=["email", "purpose", "is_verified"]),
-            models.Index(fields=["token"]),
+            models.Index(fields=["email", "purpose", "-created_at"]),
+            models.Index(fields=["expires_at"]),
         ]
         ordering = ("-created_at",)
 
     def __str__(self) -> str:  # pragma: no cover - debug helper
         return f"{self.email} -> {self.purpose}"
 
+    def save(self, *args, **kwargs):
+        # Emails are stored lowercased so lookups can match exactly and use the
+        # plain (email, ...) indexes instead of a case-insensitive scan.
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "email" in update_fields:
+            self.email = self.email.strip().lower()
+        super().save(*args, **kwargs)
+
     @property
     def is_expired(self) -> bool:
         from django.utils import timezone
@@ -1,5 +1,12 @@
+import re
+from copy import copy
+from datetime import timedelta
+
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import BooleanField, ExpressionWrapper, F, Prefetch, Q
+from django.db.models.functions import Lower
 from django.utils import timezone
 from rest_framework import serializers
 
@@ -19,7 +26,90 @@ from .models import (
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 
 
-class RegisterSerializer(serializers.ModelSerializer):
+JOURNAL_DATE_FORMAT = "%d %b %Y • %I:%M %p"
+USERNAME_RE = re.compile(r"[A-Za-z0-9]+")
+OTP_MAX_ATTEMPTS = 5
+
+# Catalog columns, shared by the serializers' Meta.fields and their values()
+# list payloads.
+GUIDANCE_RESOURCE_FIELDS = (
+    "id",
+    "resource_type",
+    "title",
+    "subtitle",
+    "summary",
+    "category",
+    "duration",
+    "media_url",
+    "thumbnail",
+    "is_featured",
+)
+MUSIC_TRACK_FIELDS = (
+    "id",
+    "title",
+    "description",
+    "duration_seconds",
+    "audio_url",
+    "mood",
+    "thumbnail",
+)
+MIND_CARE_BOOSTER_FIELDS = (
+    "id",
+    "title",
+    "subtitle",
+    "description",
+    "category",
+    "icon",
+    "action_label",
+    "prompt",
+    "estimated_seconds",
+    "resource_url",
+)
+MEDITATION_SESSION_FIELDS = (
+    "id",
+    "title",
+    "subtitle",
+    "description",
+    "category",
+    "duration_minutes",
+    "difficulty",
+    "audio_url",
+    "video_url",
+    "is_featured",
+    "thumbnail",
+)
+
+
+class CachedFieldsMixin:
+    """
+    Build a serializer's field dict once per class.
+
+    DRF deep-copies the declared fields, and for ModelSerializers introspects
+    ``Meta.fields`` against the model, on every instantiation. The result only
+    depends on the class, so it is cached and each instance receives shallow
+    copies to bind. None of the fields here nest serializers or mutate shared
+    state after construction, so a shallow copy is sufficient.
+    """
+
+    _fields_cache: dict[type, dict[str, serializers.Field]] = {}
+
+    def get_fields(self):
+        cls = type(self)
+        cached = self._fields_cache.get(cls)
+        if cached is None:
+            cached = self._fields_cache[cls] = super().get_fields()
+        return {name: copy(field) for name, field in cached.items()}
+
+
+class CachedFieldsSerializer(CachedFieldsMixin, serializers.Serializer):
+    pass
+
+
+class CachedFieldsModelSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    pass
+
+
+class RegisterSerializer(CachedFieldsModelSerializer):
     password = serializers.CharField(write_only=True, min_length=6)
     full_name = serializers.CharField(required=False, allow_blank=True)
     nickname = serializers.CharField(required=False, allow_blank=True)
@@ -41,37 +131,56 @@ class RegisterSerializer(serializers.ModelSerializer):
             "gender",
             "otp_token",
         )
+        extra_kwargs = {"username": {"validators": []}}
 
     def validate_username(self, value: str) -> str:
         normalized = value.strip()
         if not normalized:
             raise serializers.ValidationError("Username cannot be blank")
-        if not normalized.isalnum():
+        if not USERNAME_RE.fullmatch(normalized):
             raise serializers.ValidationError("Username must be letters and numbers only")
-        normalized = normalized.lower()
-        if User.objects.filter(username=normalized).exists():
-            raise serializers.ValidationError("Username already exists")
-        return normalized
+        return normalized.lower()
 
     def validate_email(self, value: str) -> str:
-        normalized = value.strip().lower()
-        if User.objects.filter(email__iexact=normalized).exists():
-            raise serializers.ValidationError("Email already in use")
-        return normalized
+        return value.strip().lower()
 
     def validate(self, attrs):
         attrs = super().validate(attrs)
+        username = attrs.get("username")
         email = attrs.get("email")
         token = attrs.get("otp_token")
         if not email:
             raise serializers.ValidationError({"email": "Email is required for registration."})
 
+        # One query covers both uniqueness checks; the model's own
+        # UniqueValidator on username is disabled in Meta.extra_kwargs.
+        taken = (
+            User.objects.annotate(email_lower=Lower("email"))
+            .filter(Q(username=username) | Q(email_lower=email))
+            .values_list("username", "email_lower")
+        )
+        errors = {}
+        for taken_username, taken_email in taken:
+            if taken_username == username:
+                errors["username"] = "Username already exists"
+            if taken_email == email:
+                errors["email"] = "Email already in use"
+        if errors:
+            raise serializers.ValidationError(errors)
+
         otp = (
-            EmailOTP.objects.filter(token=token, purpose=EmailOTP.PURPOSE_REGISTRATION, email__iexact=email)
+            EmailOTP.objects.filter(
+                token=token,
+                purpose=EmailOTP.PURPOSE_REGISTRATION,
+                email=email,
+                is_verified=True,
+                expires_at__gt=timezone.now(),
+            )
             .order_by("-created_at")
+            .only("id")
             .first()
         )
-        if not otp or not otp.is_verified or otp.is_expired:
+        if not otp:
             raise serializers.ValidationError({"otp_token": "The provided OTP token is invalid or expired."})
 
         self.context["otp_instance"] = otp
@@ -92,22 +201,23 @@ class RegisterSerializer(serializers.ModelSerializer):
         if normalized_email:
             normalized_email = normalized_email.strip().lower()
 
-        user = User.objects.create_user(
-            username=validated_data["username"],
-            email=normalized_email,
-            password=validated_data["password"],
-        )
-        profile, _ = UserProfile.objects.get_or_create(user=user)
-        for attr, value in profile_fields.items():
-            if value not in (None, "", []):
-                setattr(profile, attr, value)
-        profile.save()
-
-        otp_instance.delete()
+        with transaction.atomic():
+            user = User.objects.create_user(
+                username=validated_data["username"],
+                email=normalized_email,
+                password=validated_data["password"],
+            )
+            UserProfile.objects.create(
+                user=user,
+                **{attr: value for attr, value in profile_fields.items() if value not in (None, "", [])},
+            )
+            # The token is spent once the account exists; its cleanup needn't
+            # hold the registration transaction open.
+            transaction.on_commit(lambda pk=otp_instance.pk: EmailOTP.objects.filter(pk=pk).delete())
         return user
 
 
-class UserProfileSerializer(serializers.ModelSerializer):
+class UserProfileSerializer(CachedFieldsModelSerializer):
     username = serializers.CharField(source="user.username", read_only=True)
     email = serializers.CharField(source="user.email", read_only=True)
 
@@ -140,8 +250,12 @@ class UserProfileSerializer(serializers.ModelSerializer):
             "mood_updates_date",
         )
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        return queryset.select_related("user")
 
-class UserSettingsSerializer(serializers.ModelSerializer):
+
+class UserSettingsSerializer(CachedFieldsModelSerializer):
     class Meta:
         model = UserProfile
         fields = (
@@ -157,16 +271,16 @@ class UserSettingsSerializer(serializers.ModelSerializer):
         )
 
 
-class MoodUpdateSerializer(serializers.Serializer):
+class MoodUpdateSerializer(CachedFieldsSerializer):
     value = serializers.IntegerField(min_value=1, max_value=5)
     timezone = serializers.CharField(required=False, allow_blank=True, allow_null=True)
 
 
-class WalletRechargeSerializer(serializers.Serializer):
+class WalletRechargeSerializer(CachedFieldsSerializer):
     minutes = serializers.IntegerField(min_value=1, max_value=600)
 
 
-class WalletUsageSerializer(serializers.Serializer):
+class WalletUsageSerializer(CachedFieldsSerializer):
     SERVICE_CHOICES = (
         ("call", "Call"),
         ("chat", "Chat"),
@@ -175,7 +289,7 @@ class WalletUsageSerializer(serializers.Serializer):
     service = serializers.ChoiceField(choices=SERVICE_CHOICES)
     minutes = serializers.IntegerField(min_value=1, max_value=240)
 
-class WellnessTaskSerializer(serializers.ModelSerializer):
+class WellnessTaskSerializer(CachedFieldsModelSerializer):
     class Meta:
         model = WellnessTask
         fields = (
@@ -190,9 +304,7 @@ class WellnessTaskSerializer(serializers.ModelSerializer):
         read_only_fields = ("id", "created_at", "updated_at")
 
 
-class WellnessJournalEntrySerializer(serializers.ModelSerializer):
-    formatted_date = serializers.SerializerMethodField()
-
+class WellnessJournalEntrySerializer(CachedFieldsModelSerializer):
     class Meta:
         model = WellnessJournalEntry
         fields = (
@@ -202,35 +314,59 @@ class WellnessJournalEntrySerializer(serializers.ModelSerializer):
             "mood",
             "entry_type",
             "created_at",
-            "formatted_date",
         )
-        read_only_fields = ("id", "created_at", "formatted_date")
+        read_only_fields = ("id", "created_at")
 
-    def get_formatted_date(self, obj: WellnessJournalEntry) -> str:
-        local_dt = timezone.localtime(obj.created_at)
-        return local_dt.strftime("%d %b %Y • %I:%M %p")
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Resolved once per serializer; with many=True the child serializer,
+        # and so this timezone, is shared by every row.
+        self._tz = timezone.get_current_timezone()
 
+    def to_representation(self, instance: WellnessJournalEntry) -> dict:
+        data = super().to_representation(instance)
+        data["formatted_date"] = instance.created_at.astimezone(self._tz).strftime(JOURNAL_DATE_FORMAT)
+        return data
 
-class SupportGroupSerializer(serializers.ModelSerializer):
-    is_joined = serializers.SerializerMethodField()
 
+class SupportGroupSerializer(CachedFieldsModelSerializer):
     class Meta:
         model = SupportGroup
-        fields = ("slug", "name", "description", "icon", "is_joined")
+        fields = ("slug", "name", "description", "icon")
+
+    @classmethod
+    def setup_eager_loading(cls, queryset, user):
+        return queryset.prefetch_related(
+            Prefetch(
+                "memberships",
+                queryset=SupportGroupMembership.objects.filter(user=user),
+                to_attr="_user_memberships",
+            )
+        )
 
-    def get_is_joined(self, obj: SupportGroup) -> bool:
+    def to_representation(self, instance: SupportGroup) -> dict:
+        data = super().to_representation(instance)
+        data["is_joined"] = self._is_joined(instance)
+        return data
+
+    def _is_joined(self, obj: SupportGroup) -> bool:
+        # Querysets passed through setup_eager_loading carry the user's
+        # memberships, so rendering N groups doesn't issue N queries.
+        memberships = getattr(obj, "_user_memberships", None)
+        if memberships is not None:
+            return bool(memberships)
         request = self.context.get("request")
         if request is None or not request.user.is_authenticated:
             return False
         return SupportGroupMembership.objects.filter(user=request.user, group=obj).exists()
 
 
-class SupportGroupJoinSerializer(serializers.Serializer):
+class SupportGroupJoinSerializer(CachedFieldsSerializer):
     slug = serializers.SlugField(max_length=80)
     action = serializers.ChoiceField(choices=("join", "leave"))
 
 
-class UpcomingSessionSerializer(serializers.ModelSerializer):
+class UpcomingSessionSerializer(CachedFieldsModelSerializer):
     class Meta:
         model = UpcomingSession
         fields = (
@@ -246,40 +382,52 @@ class UpcomingSessionSerializer(serializers.ModelSerializer):
         )
         read_only_fields = ("id", "created_at", "updated_at")
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Computed once per serializer, so many=True validation shares it.
+        self._min_start_time = timezone.now() - timedelta(minutes=1)
+
     def validate_start_time(self, value):
-        if value < timezone.now() - timezone.timedelta(minutes=1):
+        if value < self._min_start_time:
             raise serializers.ValidationError("Start time must be in the future.")
         return value
 
 
-class SendOTPSerializer(serializers.Serializer):
+class SendOTPSerializer(CachedFieldsSerializer):
     email = serializers.EmailField()
 
     def validate_email(self, value):
         normalized = value.strip().lower()
-        if User.objects.filter(email__iexact=normalized).exists():
+        if User.objects.annotate(email_lower=Lower("email")).filter(email_lower=normalized).exists():
             raise serializers.ValidationError("Email is already associated with an account.")
         return normalized
 
 
-class VerifyOTPSerializer(serializers.Serializer):
+class VerifyOTPSerializer(CachedFieldsSerializer):
     email = serializers.EmailField()
     code = serializers.CharField(min_length=6, max_length=6)
 
     def validate(self, attrs):
         email = attrs["email"].strip().lower()
         code = attrs["code"].strip()
-        qs = EmailOTP.objects.filter(email__iexact=email, purpose=EmailOTP.PURPOSE_REGISTRATION).order_by("-created_at")
-        otp = qs.first()
+        otp = (
+            EmailOTP.objects.filter(email=email, purpose=EmailOTP.PURPOSE_REGISTRATION)
+            .annotate(
+                too_many=ExpressionWrapper(Q(attempts__gte=OTP_MAX_ATTEMPTS), output_field=BooleanField())
+            )
+            .only("id", "code", "token", "expires_at")
+            .order_by("-created_at")
+            .first()
+        )
         if not otp:
             raise serializers.ValidationError({"email": "No OTP request found for this email."})
         if otp.is_expired:
             raise serializers.ValidationError({"code": "OTP has expired. Please request a new one."})
-        if otp.attempts >= 5:
+        if otp.too_many:
             raise serializers.ValidationError({"code": "Too many attempts. Please request a new OTP."})
         if otp.code != code:
-            otp.attempts += 1
-            otp.save(update_fields=["attempts"])
+            # Incremented in SQL so concurrent wrong guesses are all counted.
+            EmailOTP.objects.filter(pk=otp.pk).update(attempts=F("attempts") + 1)
             raise serializers.ValidationError({"code": "Incorrect OTP code."})
 
         attrs["otp"] = otp
@@ -296,91 +444,80 @@ class EmailOrUsernameTokenObtainPairSerializer(TokenObtainPairSerializer):
         if username:
             candidate = username.strip()
             if "@" in candidate:
-                user_model = get_user_model()
-                try:
-                    user = user_model.objects.get(email__iexact=candidate)
-                    attrs[self.username_field] = user.username
-                except user_model.DoesNotExist:
-                    pass  # fall back to default behaviour (will raise invalid credentials)
+                matched_username = (
+                    get_user_model()
+                    .objects.annotate(email_lower=Lower("email"))
+                    .filter(email_lower=candidate.lower())
+                    .values_list("username", flat=True)
+                    .first()
+                )
+                # No match falls back to default behaviour (will raise invalid credentials)
+                if matched_username:
+                    attrs[self.username_field] = matched_username
         return super().validate(attrs)
 
 
-class QuickSessionSerializer(serializers.Serializer):
+class QuickSessionSerializer(CachedFieldsSerializer):
     date = serializers.DateField()
     time = serializers.TimeField()
     title = serializers.CharField(max_length=160, required=False, allow_blank=True)
     notes = serializers.CharField(required=False, allow_blank=True)
 
 
-class GuidanceResourceSerializer(serializers.ModelSerializer):
+class CatalogSerializer(CachedFieldsModelSerializer):
+    """
+    Serializer for read-only catalog content.
+
+    List endpoints call ``list_payload`` to build rows straight from
+    ``queryset.values()``, skipping model instantiation and per-field
+    ``to_representation``. The serializer itself is kept for detail and
+    write use.
+    """
+
+    @classmethod
+    def list_payload(cls, queryset) -> list[dict]:
+        return list(queryset.values(*cls.Meta.fields))
+
+
+class GuidanceResourceSerializer(CatalogSerializer):
     class Meta:
         model = GuidanceResource
-        fields = (
-            "id",
-            "resource_type",
-            "title",
-            "subtitle",
-            "summary",
-            "category",
-            "duration",
-            "media_url",
-            "thumbnail",
-            "is_featured",
-        )
-
+        fields = GUIDANCE_RESOURCE_FIELDS
 
-class MusicTrackSerializer(serializers.ModelSerializer):
-    duration = serializers.SerializerMethodField()
 
+class MusicTrackSerializer(CatalogSerializer):
     class Meta:
         model = MusicTrack
-        fields = (
-            "id",
-            "title",
-            "description",
-            "duration_seconds",
-            "duration",
-            "audio_url",
-            "mood",
-            "thumbnail",
-        )
+        fields = MUSIC_TRACK_FIELDS
 
-    def get_duration(self, obj: MusicTrack) -> str:
-        minutes, seconds = divmod(obj.duration_seconds, 60)
+    @staticmethod
+    def format_duration(total_seconds: int) -> str:
+        minutes, seconds = divmod(total_seconds, 60)
         return f"{minutes:02d}:{seconds:02d}"
 
+    @classmethod
+    def list_payload(cls, queryset) -> list[dict]:
+        rows = super().list_payload(queryset)
+        for row in rows:
+            row["duration"] = cls.format_duration(row["duration_seconds"])
+        return rows
+
+    def to_representation(self, instance: MusicTrack) -> dict:
+        # "duration" is added here rather than through a SerializerMethodField
+        # to skip DRF's per-row method field dispatch.
+        data = super().to_representation(instance)
+        data["duration"] = self.format_duration(instance.duration_seconds)
+        return data
 
-class MindCareBoosterSerializer(serializers.ModelSerializer):
+
+class MindCareBoosterSerializer(CatalogSerializer):
     class Meta:
         model = MindCareBooster
-        fields = (
-            "id",
-            "title",
-            "subtitle",
-            "description",
-            "category",
-            "icon",
-            "action_label",
-            "prompt",
-            "estimated_seconds",
-            "resource_url",
-        )
+        fields = MIND_CARE_BOOSTER_FIELDS
 
 
-class MeditationSessionSerializer(serializers.ModelSerializer):
+class MeditationSessionSerializer(CatalogSerializer):
     class Meta:
         model = MeditationSession
-        fields = (
-            "id",
-            "title",
-            "subtitle",
-            "description",
-            "category",
-            "duration_minutes",
-            "difficulty",
-            "audio_url",
-            "video_url",
-            "is_featured",
-            "thumbnail",
-        )
+        fields = MEDITATION_SESSION_FIELDS
 
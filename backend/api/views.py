@@ -80,7 +80,8 @@ class ProfileView(generics.RetrieveUpdateAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_object(self):
-        profile, _created = UserProfile.objects.get_or_create(user=self.request.user)
+        queryset = UserProfileSerializer.setup_eager_loading(UserProfile.objects.all())
+        profile, _created = queryset.get_or_create(user=self.request.user)
         return profile
 
 
@@ -104,7 +105,8 @@ class DashboardView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request):
-        profile, _ = UserProfile.objects.get_or_create(user=request.user)
+        queryset = UserProfileSerializer.setup_eager_loading(UserProfile.objects.all())
+        profile, _ = queryset.get_or_create(user=request.user)
         profile_data = UserProfileSerializer(profile).data
 
         data = {
@@ -619,17 +621,17 @@ class SupportGroupListView(APIView):
 
     def get(self, request):
         self._ensure_default_groups()
-        queryset = SupportGroup.objects.all()
+        queryset = SupportGroupSerializer.setup_eager_loading(SupportGroup.objects.all(), request.user)
+        groups = list(queryset)
         serializer = SupportGroupSerializer(
-            queryset,
+            groups,
             many=True,
             context={"request": request},
         )
-        joined_count = SupportGroupMembership.objects.filter(user=request.user).count()
         return Response(
             {
                 "groups": serializer.data,
-                "joined_count": joined_count,
+                "joined_count": sum(1 for group in groups if group._user_memberships),
             }
         )
 
@@ -896,7 +898,7 @@ class ProfessionalGuidanceListView(APIView):
         if featured:
             queryset = queryset.filter(is_featured=True)
 
-        serializer = GuidanceResourceSerializer(queryset, many=True)
+        resources = GuidanceResourceSerializer.list_payload(queryset)
         categories = (
             GuidanceResource.objects.exclude(category="")
             .order_by("category")
@@ -905,7 +907,7 @@ class ProfessionalGuidanceListView(APIView):
         )
         return Response(
             {
-                "resources": serializer.data,
+                "resources": resources,
                 "categories": list(categories),
             }
         )
@@ -920,7 +922,7 @@ class MusicTrackListView(APIView):
         if mood:
             queryset = queryset.filter(mood=mood)
 
-        serializer = MusicTrackSerializer(queryset, many=True)
+        tracks = MusicTrackSerializer.list_payload(queryset)
         moods = (
             MusicTrack.objects.order_by("mood")
             .values_list("mood", flat=True)
@@ -928,9 +930,9 @@ class MusicTrackListView(APIView):
         )
         return Response(
             {
-                "tracks": serializer.data,
+                "tracks": tracks,
                 "moods": list(moods),
-                "count": queryset.count(),
+                "count": len(tracks),
             }
         )
 
@@ -944,9 +946,9 @@ class MindCareBoosterListView(APIView):
         if category:
             queryset = queryset.filter(category=category)
 
-        serializer = MindCareBoosterSerializer(queryset, many=True)
+        boosters = MindCareBoosterSerializer.list_payload(queryset)
         grouped: dict[str, list[dict]] = defaultdict(list)
-        for item in serializer.data:
+        for item in boosters:
             grouped[item["category"]].append(item)
 
         categories = (
@@ -957,7 +959,7 @@ class MindCareBoosterListView(APIView):
         grouped_dict = {key: value for key, value in grouped.items()}
         return Response(
             {
-                "boosters": serializer.data,
+                "boosters": boosters,
                 "categories": list(categories),
                 "grouped": grouped_dict,
             }
@@ -980,10 +982,10 @@ class MeditationSessionListView(APIView):
         if featured:
             queryset = queryset.filter(is_featured=True)
 
-        serializer = MeditationSessionSerializer(queryset, many=True)
+        sessions = MeditationSessionSerializer.list_payload(queryset)
         grouped: dict[str, list[dict]] = defaultdict(list)
         featured_items = []
-        for item in serializer.data:
+        for item in sessions:
             grouped[item["category"]].append(item)
             if item["is_featured"]:
                 featured_items.append(item)
@@ -996,7 +998,7 @@ class MeditationSessionListView(APIView):
         grouped_dict = {key: value for key, value in grouped.items()}
         return Response(
             {
-                "sessions": serializer.data,
+                "sessions": sessions,
                 "categories": list(categories),
                 "grouped": grouped_dict,
                 "featured": featured_items,